@@ -5,10 +5,19 @@
 
 import sys
 import os
+import re
 import zipfile
+
+# Optional: RE2 (pip install google-re2) gives a linear-time DFA scan for the
+# highlighter patterns with an re-compatible API; fall back to stdlib re.
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
 import tempfile
 import shutil
 import importlib.util
+import functools
 import traceback
 from pathlib import Path
 
@@ -18,14 +27,15 @@ from PySide6.QtWidgets import (
     QToolButton, QMessageBox, QLabel, QSizePolicy, QFrame, QInputDialog
 )
 from PySide6.QtGui import (
-    QColor, QFont, QTextFormat, QSyntaxHighlighter, QKeySequence,
+    QColor, QFont, QTextCharFormat, QSyntaxHighlighter, QKeySequence,
     QPainter, QAction, QIcon
 )
-from PySide6.QtCore import Qt, QRect, QSize
+from PySide6.QtCore import Qt, QRect, QSize, QTimer, QObject, QRunnable, QThreadPool, Signal, QFileSystemWatcher
 
 # --------------------
 # Helper: resource_path (works with PyInstaller)
 # --------------------
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path: str) -> str:
     """
     Return absolute path to resource, works for dev and for PyInstaller bundles.
@@ -37,6 +47,45 @@ def resource_path(relative_path: str) -> str:
         base = os.path.dirname(os.path.abspath(__file__))
     return os.path.join(base, relative_path)
 
+# --------------------
+# Helpers: whole-file I/O
+# --------------------
+def _read_all_text(path) -> str:
+    """
+    Read a whole file as UTF-8 text. Unbuffered binary read: for
+    read-everything patterns the BufferedReader layer and its 8 KiB chunking
+    are pure overhead on multi-megabyte files.
+    """
+    with open(path, "rb", buffering=0) as f:
+        return f.read().decode("utf-8", errors="ignore")
+
+def _block_texts(doc):
+    """Snapshot a QTextDocument as a list of per-block (line) strings.
+
+    Must run on the GUI thread — QTextDocument is not thread-safe — but the
+    resulting list is plain Python data, safe to hand to a worker.
+    """
+    blocks = []
+    block = doc.firstBlock()
+    while block.isValid():
+        blocks.append(block.text())
+        block = block.next()
+    return blocks
+
+def _write_block_texts(path, blocks):
+    """
+    Write block texts as UTF-8 lines. Encoding per block into a 128 KiB
+    buffered stream avoids ever materializing the whole document as one
+    giant str plus a second whole-document bytes buffer, which doubles peak
+    memory on large files.
+    """
+    with open(path, "wb", buffering=1 << 17) as f:
+        last = len(blocks) - 1
+        for i, text in enumerate(blocks):
+            f.write(text.encode("utf-8"))
+            if i != last:
+                f.write(b"\n")
+
 # --------------------
 # (Short) Plugin manager scaffold (keeps plugin folder)
 # --------------------
@@ -48,6 +97,7 @@ class Plugin:
         self.path = Path(path)
         self.module = None
         self.hooks = {}
+        self.mtime = None  # plugin-main.py mtime at load, for change detection
 
 class PluginAPI:
     def __init__(self, plugin_obj, manager):
@@ -57,6 +107,7 @@ class PluginAPI:
         if name not in self._plugin.hooks:
             self._plugin.hooks[name] = []
         self._plugin.hooks[name].append(func)
+        self._manager._by_hook.setdefault(name, []).append((self._plugin, func))
     @property
     def app_name(self):
         return "Scriptor"
@@ -66,24 +117,66 @@ class PluginManager:
         self.app = app
         PLUGINS_DIR.mkdir(exist_ok=True)
         self.plugins = {}
-        # we don't auto-load here to keep things simple; call load_all_plugins() as needed
-        self.load_all_plugins()
+        # inverted hook index: hook name -> [(plugin, func), ...], so a
+        # dispatch touches only the handlers registered for that hook rather
+        # than probing every plugin's hooks dict
+        self._by_hook = {}
+        # Loading is deferred: exec'ing every plugin-main.py at startup would
+        # block the UI thread before the first paint. _ensure_loaded() runs
+        # once, the first time plugins are actually needed.
+        self._loaded = False
+        # Watch the plugins dir so changes reconcile incrementally instead of
+        # requiring a full rescan+re-exec via "Reload Plugins".
+        self._watcher = QFileSystemWatcher([str(PLUGINS_DIR)])
+        self._watcher.directoryChanged.connect(self._on_plugins_dir_changed)
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self.load_all_plugins()
+
+    def _on_plugins_dir_changed(self, _path):
+        # Only reconcile if plugins were already loaded; don't let a stray
+        # directory event defeat the lazy startup.
+        if self._loaded:
+            self.load_all_plugins()
+
+    def _forget_plugin(self, name):
+        plugin = self.plugins.pop(name, None)
+        if plugin is None:
+            return None
+        for handlers in self._by_hook.values():
+            handlers[:] = [(p, f) for p, f in handlers if p is not plugin]
+        return plugin
 
     def load_all_plugins(self):
-        self.plugins.clear()
+        # Incremental: load_plugin_from_dir skips plugins whose
+        # plugin-main.py mtime is unchanged, so only new or edited plugins
+        # pay the exec_module cost; vanished ones are dropped afterwards.
+        self._loaded = True
+        present = set()
         for p in PLUGINS_DIR.iterdir():
             if p.is_dir():
+                present.add(p.name)
                 try:
                     self.load_plugin_from_dir(p)
                 except Exception as e:
                     print("Failed loading plugin", p, e)
+        for name in list(self.plugins):
+            if name not in present:
+                self._forget_plugin(name)
 
     def load_plugin_from_dir(self, path: Path):
         name = path.name
-        plugin = Plugin(name, path)
         main = path / "plugin-main.py"
         if not main.exists():
             raise FileNotFoundError(f"plugin-main.py missing in {path}")
+        mtime = main.stat().st_mtime
+        existing = self.plugins.get(name)
+        if existing is not None and existing.mtime == mtime:
+            return  # unchanged since last load
+        self._forget_plugin(name)
+        plugin = Plugin(name, path)
+        plugin.mtime = mtime
         spec = importlib.util.spec_from_file_location(f"scriptor_plugin_{name}", str(main))
         module = importlib.util.module_from_spec(spec)
         try:
@@ -102,40 +195,63 @@ class PluginManager:
         print("Loaded plugin:", name)
 
     def install_plugin(self, scpl_path: str):
+        dest = self.extract_plugin(scpl_path)
+        self.load_plugin_from_dir(dest)
+        return dest
+
+    def extract_plugin(self, scpl_path: str) -> Path:
+        """Validate and unpack a .scpl into PLUGINS_DIR without loading it.
+
+        Pure disk work — safe to run off the GUI thread; call
+        load_plugin_from_dir with the returned path afterwards. Extraction
+        happens in a temporary directory outside PLUGINS_DIR and is renamed
+        into place once complete, so the directory watcher never observes a
+        half-extracted plugin.
+        """
         scpl = Path(scpl_path)
         if not scpl.exists():
             raise FileNotFoundError(scpl_path)
-        with zipfile.ZipFile(scpl, "r") as z:
-            if "plugin-main.py" not in z.namelist():
-                raise RuntimeError(".scpl must contain plugin-main.py at root")
+        # same parent as PLUGINS_DIR so the final rename stays on one
+        # filesystem (and is therefore atomic)
+        tmp = Path(tempfile.mkdtemp(prefix=".scpl-extract-", dir=str(PLUGINS_DIR.parent)))
+        try:
+            with zipfile.ZipFile(scpl, "r") as z:
+                # Parse the archive directory once: validate the marker and
+                # extract from the same infolist instead of materializing
+                # namelist() and then letting extractall re-iterate.
+                infos = z.infolist()
+                if not any(info.filename == "plugin-main.py" for info in infos):
+                    raise RuntimeError(".scpl must contain plugin-main.py at root")
+                for info in infos:
+                    z.extract(info, tmp)
             base = scpl.stem
             dest = PLUGINS_DIR / base
             idx = 1
             while dest.exists():
                 dest = PLUGINS_DIR / f"{base}_{idx}"
                 idx += 1
-            z.extractall(dest)
-        self.load_plugin_from_dir(dest)
+            os.rename(tmp, dest)
+        except Exception:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
         return dest
 
     def uninstall_plugin(self, name: str):
         if name not in self.plugins:
             raise KeyError(name)
-        path = self.plugins[name].path
-        self.plugins.pop(name, None)
-        shutil.rmtree(path)
+        plugin = self.plugins.pop(name)
+        for handlers in self._by_hook.values():
+            handlers[:] = [(p, f) for p, f in handlers if p is not plugin]
+        shutil.rmtree(plugin.path)
         return True
 
     def call_hook(self, hook_name, *args, **kwargs):
-        for plugin in list(self.plugins.values()):
-            funcs = plugin.hooks.get(hook_name)
-            if not funcs:
-                continue
-            for f in funcs:
-                try:
-                    f(*args, **kwargs)
-                except Exception:
-                    print(f"Plugin {plugin.name} hook {hook_name} error:\n", traceback.format_exc())
+        self._ensure_loaded()
+        for plugin, f in list(self._by_hook.get(hook_name, ())):
+            try:
+                f(*args, **kwargs)
+            except Exception:
+                print(f"Plugin {plugin.name} hook {hook_name} error:\n", traceback.format_exc())
 
 # --------------------
 # Hooks adapter
@@ -159,18 +275,22 @@ class LineNumberArea(QWidget):
     def paintEvent(self, event): self.editor.paint_line_numbers(event)
 
 class MultiLangHighlighter(QSyntaxHighlighter):
+    # Rules are combined into one alternation per language, so order is
+    # priority: the engine takes the first alternative that matches at a
+    # position. Most-specific first (triple strings, then strings/comments,
+    # then keywords) so e.g. a '#' inside a string stays a string.
     LANG_RULES = {
         "python": [
-            (r"\b(def|class|return|if|else|elif|for|while|import|from|as|pass|break|continue|with|try|except|finally|lambda|yield|async|await|assert|raise|global|nonlocal|del)\b", "#569cd6"),
             (r'"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'', "#ce9178"),
             (r"\".*?\"|'.*?'", "#ce9178"),
             (r"#.*", "#6a9955"),
+            (r"\b(def|class|return|if|else|elif|for|while|import|from|as|pass|break|continue|with|try|except|finally|lambda|yield|async|await|assert|raise|global|nonlocal|del)\b", "#569cd6"),
             (r"\b(True|False|None)\b", "#569cd6"),
         ],
         "javascript": [
-            (r"\b(function|return|var|let|const|if|else|for|while|break|continue|import|from|export|class|new|this|throw|try|catch)\b", "#569cd6"),
-            (r"//.*", "#6a9955"),
             (r"\".*?\"|'.*?'", "#ce9178"),
+            (r"//.*", "#6a9955"),
+            (r"\b(function|return|var|let|const|if|else|for|while|break|continue|import|from|export|class|new|this|throw|try|catch)\b", "#569cd6"),
         ],
         "html": [
             (r"<!--[\s\S]*?-->", "#6a9955"),
@@ -180,14 +300,45 @@ class MultiLangHighlighter(QSyntaxHighlighter):
     }
     EXT_MAP = { ".py": "python", ".js": "javascript", ".mjs": "javascript", ".html": "html", ".htm": "html" }
 
+    # Each language's rules are collapsed into a single compiled alternation
+    # (one named group per rule), built once and shared across documents: one
+    # finditer pass per line instead of one per rule, with shared
+    # QTextCharFormat instances. highlightBlock runs on every edited line so
+    # per-call compilation and repeated scans add up fast.
+    _COMPILED = {}
+
+    @classmethod
+    def _combined_rules(cls, language):
+        cached = cls._COMPILED.get(language)
+        if cached is None:
+            rules = cls.LANG_RULES.get(language, [])
+            if not rules:
+                cached = (None, ())
+            else:
+                pattern = _re.compile("|".join(f"(?P<g{i}>{p})" for i, (p, _) in enumerate(rules)))
+                fmts = []
+                for _, color in rules:
+                    fmt = QTextCharFormat()
+                    fmt.setForeground(QColor(color))
+                    fmts.append(fmt)
+                # Rule patterns may contain their own capturing groups, which
+                # shifts group numbers; map every group number back to the
+                # format of the rule that owns it so m.lastindex dispatches
+                # directly.
+                fmt_for_group = [None] * (pattern.groups + 1)
+                starts = [pattern.groupindex[f"g{i}"] for i in range(len(rules))]
+                starts.append(pattern.groups + 1)
+                for i in range(len(rules)):
+                    for g in range(starts[i], starts[i + 1]):
+                        fmt_for_group[g] = fmts[i]
+                cached = (pattern, fmt_for_group)
+            cls._COMPILED[language] = cached
+        return cached
+
     def __init__(self, doc, language="python"):
         super().__init__(doc)
         self.language = language
-        self.rules = []
-        for pattern, color in self.LANG_RULES.get(language, []):
-            fmt = QTextFormat()
-            fmt.setForeground(QColor(color))
-            self.rules.append((pattern, fmt))
+        self._combined, self._formats = self._combined_rules(language)
 
     @classmethod
     def language_for_filename(cls, fname):
@@ -195,37 +346,91 @@ class MultiLangHighlighter(QSyntaxHighlighter):
         return cls.EXT_MAP.get(ext, "python")
 
     def highlightBlock(self, text):
-        import re
-        for pattern, fmt in self.rules:
-            for m in re.finditer(pattern, text):
-                self.setFormat(m.start(), m.end()-m.start(), fmt)
+        combined = self._combined
+        if combined is None:
+            return
+        # Hot loop: bind lookups to locals and take both span ends in one
+        # call, so each match costs the minimum of interpreter dispatch.
+        set_format = self.setFormat
+        formats = self._formats
+        for m in combined.finditer(text):
+            start, end = m.span()
+            set_format(start, end - start, formats[m.lastindex])
 
 class CodeEditor(QPlainTextEdit):
-    def __init__(self, filename=None):
+    # Gutter palettes per theme, built once instead of re-parsing hex strings
+    # on every paint event; the active one is pushed down by the main window
+    # on theme changes so the paint path never walks up via window().
+    _PALETTES = {
+        True:  {"bg": QColor("#1f1f1f"), "sep": QColor("#3c3c3c"), "num": QColor("#9ea7b1")},
+        False: {"bg": QColor("#f0f0f0"), "sep": QColor("#d0d0d0"), "num": QColor("#444444")},
+    }
+
+    def __init__(self, filename=None, content=""):
         super().__init__()
         self.file_path = Path(filename) if filename else None
+        self._pal = self._PALETTES[True]
         self.setFont(QFont("Consolas", 12))
         self.setTabStopDistance(4 * self.fontMetrics().horizontalAdvance(' '))
+        self._digit_w = self.fontMetrics().horizontalAdvance('9')
+        self._cached_digits = -1
+        self._cached_width = 0
         self.cursorPositionChanged.connect(self._cursor_changed)
         self.blockCountChanged.connect(self.update_margins)
         self.updateRequest.connect(self.update_line_numbers)
         self.textChanged.connect(self._on_text_changed)
+        # Coalesce per-keystroke work (tab title + status refresh): fast
+        # typing starts the timer repeatedly but flushes only once per 30 ms.
+        self._dirty_timer = QTimer(self)
+        self._dirty_timer.setSingleShot(True)
+        self._dirty_timer.setInterval(30)
+        self._dirty_timer.timeout.connect(self._flush_dirty)
         self.line_area = LineNumberArea(self)
         self.update_margins(0)
         self.setViewportMargins(self.line_number_width(), 0, 6, 0)
+        # Set the content before attaching the highlighter: attaching runs
+        # one full-document pass, so text inserted afterwards would be
+        # highlighted twice.
+        if content:
+            self.setPlainText(content)
         lang = MultiLangHighlighter.language_for_filename(str(self.file_path) if self.file_path else "")
         self.highlighter = MultiLangHighlighter(self.document(), language=lang)
 
     def set_language(self, lang):
+        if lang == getattr(self.highlighter, "language", None):
+            return  # already highlighting this language
         self.highlighter = MultiLangHighlighter(self.document(), language=lang)
         self.rehighlight()
 
     def rehighlight(self):
-        self.highlighter.rehighlight()
+        # A full rehighlight re-applies formats block by block; left alone,
+        # every block emits contentsChange and fans the status/title
+        # listeners out once per block. Suppress document signals for the
+        # pass and schedule a single repaint at the end.
+        doc = self.document()
+        doc.blockSignals(True)
+        try:
+            self.highlighter.rehighlight()
+        finally:
+            doc.blockSignals(False)
+        self.viewport().update()
+
+    def setFont(self, font):
+        super().setFont(font)
+        # Digit advance depends on the font; recompute and drop the cached
+        # width so line_number_width picks up the new metrics.
+        self._digit_w = self.fontMetrics().horizontalAdvance('9')
+        self._cached_digits = -1
 
     def line_number_width(self):
+        # Called at paint/resize rate; fontMetrics()+horizontalAdvance are
+        # comparatively expensive, so cache the width per digit count.
         digits = len(str(max(1, self.blockCount())))
-        return 14 + self.fontMetrics().horizontalAdvance('9') * digits
+        if digits == self._cached_digits:
+            return self._cached_width
+        self._cached_width = 14 + self._digit_w * digits
+        self._cached_digits = digits
+        return self._cached_width
 
     def update_margins(self, _=0):
         self.setViewportMargins(self.line_number_width(), 0, 6, 0)
@@ -244,30 +449,38 @@ class CodeEditor(QPlainTextEdit):
     def paint_line_numbers(self, event):
         painter = QPainter(self.line_area)
         try:
-            bg = QColor("#1f1f1f") if self.window()._dark else QColor("#f0f0f0")
-            painter.fillRect(event.rect(), bg)
+            pal = self._pal
+            fh = self.fontMetrics().height()
+            width = self.line_area.width()
+            painter.fillRect(event.rect(), pal["bg"])
             block = self.firstVisibleBlock()
             top = int(self.blockBoundingGeometry(block).translated(self.contentOffset()).top())
-            bottom = top + int(self.blockBoundingRect(block).height())
-            gutter_right = self.line_area.width() - 1
-            painter.setPen(QColor("#3c3c3c") if self.window()._dark else QColor("#d0d0d0"))
+            gutter_right = width - 1
+            painter.setPen(pal["sep"])
             painter.drawLine(gutter_right, event.rect().top(), gutter_right, event.rect().bottom())
-            num_color = QColor("#9ea7b1") if self.window()._dark else QColor("#444444")
-            painter.setPen(num_color)
+            painter.setPen(pal["num"])
+            # One blockBoundingRect layout query per block: each iteration's
+            # bottom becomes the next iteration's top.
             while block.isValid() and top <= event.rect().bottom():
+                bottom = top + int(self.blockBoundingRect(block).height())
                 if block.isVisible() and bottom >= event.rect().top():
                     number = str(block.blockNumber() + 1)
-                    painter.drawText(0, top, self.line_area.width() - 8, self.fontMetrics().height(), Qt.AlignRight | Qt.AlignVCenter, number)
+                    painter.drawText(0, top, width - 8, fh, Qt.AlignRight | Qt.AlignVCenter, number)
                 block = block.next()
                 top = bottom
-                bottom = top + int(self.blockBoundingRect(block).height())
         finally:
             painter.end()
 
     def _on_text_changed(self):
+        self._dirty_timer.start()
+
+    def _flush_dirty(self):
         parent = self.parent()
-        if parent and hasattr(parent.window(), "refresh_tab_title_for_editor"):
-            parent.window().refresh_tab_title_for_editor(self)
+        if not parent:
+            return
+        window = parent.window()
+        if hasattr(window, "refresh_tab_title_for_editor"):
+            window.refresh_tab_title_for_editor(self)
 
     def is_modified_since_save(self):
         return self.document().isModified()
@@ -354,6 +567,28 @@ class Ribbon(QWidget):
         for b in self._controls["buttons"]:
             b.setStyleSheet(f"color: {btn_text}; background: transparent;")
 
+# --------------------
+# Background I/O (keeps disk latency off the GUI thread)
+# --------------------
+class _TaskSignals(QObject):
+    finished = Signal(object)
+    failed = Signal(str)
+
+class _Task(QRunnable):
+    """Run fn() on the global thread pool; deliver the result (or the error
+    string) back to the GUI thread via queued signals."""
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = _TaskSignals()
+    def run(self):
+        try:
+            result = self.fn()
+        except Exception as e:
+            self.signals.failed.emit(f"{e}")
+        else:
+            self.signals.finished.emit(result)
+
 # --------------------
 # Main Window
 # --------------------
@@ -364,15 +599,24 @@ class Scriptor(QMainWindow):
         self.resize(1000, 700)
         self._dark = True
 
-        # Attempt to set window icon (if available)
-        ico = resource_path("scriptor.ico")
-        if os.path.exists(ico):
-            self.setWindowIcon(QIcon(ico))
+        # Attempt to set window icon (if available). If the application
+        # already carries one (set in __main__), reuse it instead of decoding
+        # the .ico again.
+        app_icon = QApplication.windowIcon()
+        if not app_icon.isNull():
+            self.setWindowIcon(app_icon)
+        else:
+            ico = resource_path("scriptor.ico")
+            if os.path.exists(ico):
+                self.setWindowIcon(QIcon(ico))
 
         # plugin manager + hooks
         self.plugin_manager = PluginManager(self)
         self.hooks = Hooks(self.plugin_manager)
 
+        # in-flight background tasks (kept alive until their signals fire)
+        self._tasks = set()
+
         # layout
         central = QWidget()
         vbox = QVBoxLayout(central)
@@ -391,6 +635,10 @@ class Scriptor(QMainWindow):
         self.tabs.setTabsClosable(True)
         self.tabs.setMovable(True)
         self.tabs.tabCloseRequested.connect(self.close_tab)
+        # exactly one live textChanged->status connection — the visible
+        # editor's — swapped as the current tab changes
+        self._active_editor = None
+        self.tabs.currentChanged.connect(self._on_current_tab_changed)
         vbox.addWidget(self.tabs)
 
         self.setCentralWidget(central)
@@ -404,6 +652,13 @@ class Scriptor(QMainWindow):
         self.status.addPermanentWidget(self.status_right, 0)
         self.setStatusBar(self.status)
 
+        # Coalesce status refreshes: bursts of keystrokes/cursor moves yield
+        # one repaint of the status bar instead of one per event.
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(30)
+        self._status_timer.timeout.connect(self._do_update_status)
+
         self._create_actions_and_menus()
         self._apply_dark_theme()
         self.new_tab()
@@ -431,10 +686,9 @@ class Scriptor(QMainWindow):
         self._actions = {"new":new_act,"open":open_act,"save":save_act,"save_as":save_as_act,"close":close_act,"exit":exit_act,"undo":undo_act,"redo":redo_act,"theme":theme_act}
 
     def new_tab(self, path=None, content=""):
-        editor = CodeEditor(path)
-        editor.textChanged.connect(self.update_status)
+        editor = CodeEditor(path, content)
+        editor._pal = CodeEditor._PALETTES[self._dark]
         if path and content:
-            editor.setPlainText(content)
             editor.set_saved_state()
         title = editor.file_path.name if editor.file_path else "Untitled"
         idx = self.tabs.addTab(editor, title)
@@ -446,44 +700,110 @@ class Scriptor(QMainWindow):
     def current_editor(self):
         w = self.tabs.currentWidget(); return w if isinstance(w, CodeEditor) else None
 
+    def _on_current_tab_changed(self, _idx):
+        if self._active_editor is not None:
+            try:
+                self._active_editor.textChanged.disconnect(self.update_status)
+            except RuntimeError:
+                pass  # editor already deleted or connection gone
+        editor = self.current_editor()
+        self._active_editor = editor
+        if editor is not None:
+            editor.textChanged.connect(self.update_status)
+        self.update_status()
+
+    def _run_task(self, fn, on_done, on_error):
+        """Run fn on the thread pool; on_done/on_error run queued on the GUI
+        thread. The task is kept referenced until one of them fires."""
+        task = _Task(fn)
+        self._tasks.add(task)
+        def _done(result):
+            self._tasks.discard(task); on_done(result)
+        def _failed(msg):
+            self._tasks.discard(task); on_error(msg)
+        task.signals.finished.connect(_done, Qt.QueuedConnection)
+        task.signals.failed.connect(_failed, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(task)
+
     def open_file(self):
         path, _ = QFileDialog.getOpenFileName(self, "Open File", "", "All Files (*);;Python Files (*.py);;JS Files (*.js);;HTML Files (*.html *.htm)")
         if not path: return
-        try:
-            content = Path(path).read_text(encoding="utf-8", errors="ignore")
-        except Exception as e:
-            QMessageBox.warning(self, "Open failed", f"Could not open file:\n{e}"); return
-        self.new_tab(path, content); self.hooks.on_open(path)
+        # read+decode on a worker; tab creation back on the GUI thread
+        self._run_task(
+            lambda: _read_all_text(path),
+            lambda content: (self.new_tab(path, content), self.hooks.on_open(path)),
+            lambda msg: QMessageBox.warning(self, "Open failed", f"Could not open file:\n{msg}"))
 
     def save_file(self):
-        editor = self.current_editor(); 
+        editor = self.current_editor();
         if not editor: return
         if not editor.file_path: return self.save_file_as()
-        try:
-            editor.file_path.write_text(editor.toPlainText(), encoding="utf-8")
-            editor.set_saved_state(); self.refresh_tab_title_for_editor(editor); self.hooks.on_save(str(editor.file_path))
-        except Exception as e:
-            QMessageBox.warning(self, "Save failed", f"Could not save file:\n{e}")
+        # snapshot per-block text on the GUI thread (QTextDocument is not
+        # thread-safe); only the disk write runs on the worker
+        blocks = _block_texts(editor.document()); dest = editor.file_path
+        rev = editor.document().revision()
+        def done(_):
+            # only clear the modified flag if nothing was typed while the
+            # write was in flight — those edits are not on disk yet
+            if editor.document().revision() == rev:
+                editor.set_saved_state()
+            self.refresh_tab_title_for_editor(editor); self.hooks.on_save(str(dest))
+        self._run_task(
+            lambda: _write_block_texts(dest, blocks),
+            done,
+            lambda msg: QMessageBox.warning(self, "Save failed", f"Could not save file:\n{msg}"))
 
     def save_file_as(self):
-        editor = self.current_editor(); 
+        editor = self.current_editor();
         if not editor: return
         path, _ = QFileDialog.getSaveFileName(self, "Save File As", "", "All Files (*);;Python Files (*.py)")
         if not path: return
+        blocks = _block_texts(editor.document())
+        rev = editor.document().revision()
+        def done(_):
+            editor.file_path = Path(path)
+            # see save_file: keep the modified flag if edits arrived while
+            # the write was in flight
+            if editor.document().revision() == rev:
+                editor.set_saved_state()
+            idx = self.tabs.indexOf(editor)
+            if idx >= 0:
+                self.tabs.setTabToolTip(idx, str(editor.file_path))
+            self.refresh_tab_title_for_editor(editor)
+            self.hooks.on_save(str(editor.file_path))
+        self._run_task(
+            lambda: _write_block_texts(path, blocks),
+            done,
+            lambda msg: QMessageBox.warning(self, "Save As failed", f"Could not save file:\n{msg}"))
+
+    def _save_editor_sync(self, editor):
+        """Blocking save, used by the close paths which must know whether the
+        save succeeded before discarding the tab."""
+        if not editor.file_path:
+            path, _ = QFileDialog.getSaveFileName(self, "Save File As", "", "All Files (*);;Python Files (*.py)")
+            if not path: return False
+            editor.file_path = Path(path)
         try:
-            Path(path).write_text(editor.toPlainText(), encoding="utf-8"); editor.file_path = Path(path); editor.set_saved_state()
-            idx = self.tabs.currentIndex(); self.tabs.setTabText(idx, editor.file_path.name); self.tabs.setTabToolTip(idx, str(editor.file_path)); self.hooks.on_save(str(editor.file_path))
+            _write_block_texts(editor.file_path, _block_texts(editor.document()))
         except Exception as e:
-            QMessageBox.warning(self, "Save As failed", f"Could not save file:\n{e}")
+            QMessageBox.warning(self, "Save failed", f"Could not save file:\n{e}"); return False
+        editor.set_saved_state(); self.refresh_tab_title_for_editor(editor); self.hooks.on_save(str(editor.file_path))
+        return True
 
     def install_plugin(self):
         path, _ = QFileDialog.getOpenFileName(self, "Install Plugin (.scpl zip)", "", "Plugin packages (*.scpl *.zip)")
         if not path: return
-        try:
-            dest = self.plugin_manager.install_plugin(path)
-        except Exception as e:
-            QMessageBox.warning(self, "Install failed", f"{e}"); return
-        QMessageBox.information(self, "Plugin installed", f"Installed to: {dest}")
+        # zip extraction on a worker; module load stays on the GUI thread
+        def done(dest):
+            try:
+                self.plugin_manager.load_plugin_from_dir(dest)
+            except Exception as e:
+                QMessageBox.warning(self, "Install failed", f"{e}"); return
+            QMessageBox.information(self, "Plugin installed", f"Installed to: {dest}")
+        self._run_task(
+            lambda: self.plugin_manager.extract_plugin(path),
+            done,
+            lambda msg: QMessageBox.warning(self, "Install failed", f"{msg}"))
 
     def reload_plugins(self):
         try:
@@ -493,6 +813,7 @@ class Scriptor(QMainWindow):
             QMessageBox.warning(self, "Reload failed", f"{e}")
 
     def uninstall_plugin(self):
+        self.plugin_manager._ensure_loaded()
         names = list(self.plugin_manager.plugins.keys())
         if not names:
             QMessageBox.information(self, "No plugins", "No installed plugins to remove."); return
@@ -509,8 +830,8 @@ class Scriptor(QMainWindow):
             resp = QMessageBox.question(self, "Unsaved changes", "This tab has unsaved changes. Save before closing?", QMessageBox.StandardButtons(QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel))
             if resp == QMessageBox.Cancel: return
             if resp == QMessageBox.Yes:
-                self.tabs.setCurrentIndex(index); self.save_file()
-                if editor.is_modified_since_save(): return
+                self.tabs.setCurrentIndex(index)
+                if not self._save_editor_sync(editor): return
         self.tabs.removeTab(index)
         if self.tabs.count() == 0: self.new_tab()
 
@@ -530,21 +851,28 @@ class Scriptor(QMainWindow):
         self.new_tab()
 
     def update_status(self):
+        self._status_timer.start()
+
+    def _do_update_status(self):
         editor = self.current_editor()
         if not editor:
             self.status_left.setText(""); self.status_right.setText(""); return
         cursor = editor.textCursor()
         modified = "*" if editor.is_modified_since_save() else ""
         path = editor.file_path.name if editor.file_path else "Untitled"
-        chars = len(editor.toPlainText()); lines = editor.blockCount()
+        # characterCount is O(1) and counts Qt's trailing end-of-document
+        # character; toPlainText() would copy the whole buffer just for len().
+        chars = editor.document().characterCount() - 1; lines = editor.blockCount()
         self.status_left.setText(f"{modified}{path}"); self.status_right.setText(f"Line {cursor.blockNumber()+1}, Col {cursor.columnNumber()+1} — {lines}L • {chars}ch")
 
     def refresh_tab_title_for_editor(self, editor):
-        for i in range(self.tabs.count()):
-            if self.tabs.widget(i) is editor:
-                title = editor.file_path.name if editor.file_path else "Untitled"
-                if editor.is_modified_since_save(): title = "*" + title
-                self.tabs.setTabText(i, title); break
+        # indexOf does the widget scan in Qt rather than one Python-level
+        # widget() call per tab
+        i = self.tabs.indexOf(editor)
+        if i < 0: return
+        title = editor.file_path.name if editor.file_path else "Untitled"
+        if editor.is_modified_since_save(): title = "*" + title
+        self.tabs.setTabText(i, title)
 
     def refresh_tab_title(self):
         for i in range(self.tabs.count()):
@@ -555,23 +883,33 @@ class Scriptor(QMainWindow):
                 self.tabs.setTabText(i, title)
 
     def toggle_theme(self):
-        self._dark = not self._dark
-        if self._dark: self._apply_dark_theme()
-        else: self._apply_light_theme()
+        # Suspend updates for the whole switch: the stylesheet re-resolve and
+        # per-editor palette pushes then coalesce into one repaint instead of
+        # scheduling a paint per widget.
+        self.setUpdatesEnabled(False)
+        try:
+            self._dark = not self._dark
+            if self._dark: self._apply_dark_theme()
+            else: self._apply_light_theme()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
     def _apply_dark_theme(self):
         self.setStyleSheet("""QMainWindow{background:#1e1e1e;color:#d4d4d4;} QPlainTextEdit{background:#1b1b1b;color:#d4d4d4; selection-background-color:#264f78; padding:6px;} QTabBar::tab{background:#2d2d2d;padding:8px 12px;margin-right:2px;color:#d4d4d4;} QTabBar::tab:selected{background:#1f1f1f;border-bottom:2px solid #007acc;} QStatusBar{background:#007acc;color:white;} QMenuBar{background:#2d2d2d;color:#d4d4d4;}""")
         self.ribbon.set_theme(dark=True)
         for i in range(self.tabs.count()):
             w = self.tabs.widget(i)
-            if isinstance(w, CodeEditor): w.viewport().update()
+            if isinstance(w, CodeEditor):
+                w._pal = CodeEditor._PALETTES[True]
 
     def _apply_light_theme(self):
         self.setStyleSheet("""QMainWindow{background:#f0f0f0;color:#2b2b2b;} QPlainTextEdit{background:#ffffff;color:#2b2b2b; selection-background-color:#cce0ff; padding:6px;} QTabBar::tab{background:#e8e8e8;padding:8px 12px;margin-right:2px;color:#2b2b2b;} QTabBar::tab:selected{background:#ffffff;border-bottom:2px solid #007acc;} QStatusBar{background:#e0e0e0;color:#2b2b2b;} QMenuBar{background:#e8e8e8;color:#2b2b2b;}""")
         self.ribbon.set_theme(dark=False)
         for i in range(self.tabs.count()):
             w = self.tabs.widget(i)
-            if isinstance(w, CodeEditor): w.viewport().update()
+            if isinstance(w, CodeEditor):
+                w._pal = CodeEditor._PALETTES[False]
 
     def closeEvent(self, event):
         for i in range(self.tabs.count()-1, -1, -1):
@@ -582,8 +920,7 @@ class Scriptor(QMainWindow):
                 if resp == QMessageBox.Cancel:
                     event.ignore(); return
                 if resp == QMessageBox.Yes:
-                    self.save_file()
-                    if editor.is_modified_since_save():
+                    if not self._save_editor_sync(editor):
                         event.ignore(); return
         event.accept()
 
@@ -593,15 +930,16 @@ class Scriptor(QMainWindow):
 if __name__ == "__main__":
     app = QApplication(sys.argv)
 
-    # apply window icon (works in dev and when bundled with PyInstaller)
+    # apply window icon (works in dev and when bundled with PyInstaller);
+    # decode the .ico once and share the QIcon app- and window-level
     icon_path = resource_path("scriptor.ico")
-    if os.path.exists(icon_path):
-        app.setWindowIcon(QIcon(icon_path))
+    icon = QIcon(icon_path) if os.path.exists(icon_path) else None
+    if icon:
+        app.setWindowIcon(icon)
 
     win = Scriptor()
-    # set again on the window (redundant but ensures window-level icon)
-    if os.path.exists(icon_path):
-        win.setWindowIcon(QIcon(icon_path))
+    if icon:
+        win.setWindowIcon(icon)
 
     win.show()
     sys.exit(app.exec())